@@ -5,35 +5,80 @@ This module provides REST API services for the educational platform,
 including user management, content delivery, progress tracking, and assessment.
 """
 
+import asyncio
+import hashlib
+import itertools
 import logging
 import os
+import sys
+import threading
+import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import anyio.to_thread
+import bcrypt
+import orjson
 import uvicorn
+from cachetools import TTLCache
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from fastapi import FastAPI, HTTPException, Depends, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, EmailStr
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 import jwt
-from passlib.context import CryptContext
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    force=True,
 )
 logger = logging.getLogger(__name__)
 
 # Security
 security = HTTPBearer()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
-ALGORITHM = "HS2"
+# bcrypt work factor; lower it in development to speed up registration
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Checked against for unknown usernames so login timing does not reveal them
+DUMMY_PASSWORD_HASH = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+ALGORITHM = "EdDSA"
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=15)
+# Cached tokens are reissued once less than this much lifetime remains
+TOKEN_REUSE_MIN_LIFETIME = timedelta(minutes=5)
+
+
+def load_signing_key() -> Ed25519PrivateKey:
+    """Load the Ed25519 token signing key from JWT_PRIVATE_KEY (PEM)."""
+    pem = os.getenv("JWT_PRIVATE_KEY")
+    if pem:
+        return serialization.load_pem_private_key(pem.encode(), password=None)
+    logger.warning(
+        "JWT_PRIVATE_KEY not set; using an ephemeral signing key. "
+        "Tokens will not survive restarts or verify across workers."
+    )
+    return Ed25519PrivateKey.generate()
+
+
+SIGNING_KEY = load_signing_key()
+VERIFY_KEY = SIGNING_KEY.public_key()
+
+# Worker threads available for sync endpoints/dependencies (AnyIO default is 40)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+# Verified tokens, keyed by SHA-256 digest; short TTL so revocations propagate quickly
+_token_cache = TTLCache(maxsize=10_000, ttl=5)
+_token_cache_lock = threading.Lock()
 
 # Database setup (placeholder)
 def get_db():
@@ -47,16 +92,27 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting education platform backend...")
     
+    # Size the threadpool used for sync dependencies such as verify_token
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
     # Initialize database
     await initialize_database()
     
     # Load initial content
     await load_content_data()
     
+    # Share cached responses across workers when Redis is configured
+    global response_cache
+    response_cache = ResponseCache(os.getenv("REDIS_URL"))
+    
+    # Refresh the health payload in the background
+    health_task = asyncio.create_task(refresh_health_json())
+    
     logger.info("Backend startup complete.")
     yield
     
     logger.info("Shutting down education platform backend...")
+    health_task.cancel()
     await cleanup_resources()
     logger.info("Backend shutdown complete.")
 
@@ -67,8 +123,11 @@ app = FastAPI(
     description="Backend API for AI limitations and solutions educational platform",
     version="1.0.0",
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    # Served by the routes below from a schema built once at startup
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
 # Add middleware
@@ -79,7 +138,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Level 1 compresses JSON nearly as well as the default level 9 at a fraction of the CPU
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
 
 
 # Pydantic models
@@ -180,11 +240,112 @@ class AssessmentSubmission(BaseModel):
     submitted_at: datetime
 
 
+# Response cache
+class ResponseCache:
+    """Cache-aside store for serialized responses.
+    
+    Backed by Redis when a URL is given, otherwise by an in-process TTL cache.
+    Redis failures are logged and treated as misses, so requests fall back to
+    building the response rather than failing.
+    """
+    
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 30):
+        self.ttl = ttl
+        self._redis = Redis.from_url(redis_url) if redis_url else None
+        self._local = TTLCache(maxsize=10_000, ttl=ttl)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached payload."""
+        if self._redis is not None:
+            try:
+                return await self._redis.get(key)
+            except RedisError as e:
+                logger.warning("Response cache get failed for %s: %s", key, e)
+                return None
+        return self._local.get(key)
+    
+    async def set(self, key: str, value: bytes) -> None:
+        """Cache a payload for the configured TTL."""
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, value, ex=self.ttl)
+            except RedisError as e:
+                logger.warning("Response cache set failed for %s: %s", key, e)
+        else:
+            self._local[key] = value
+    
+    async def delete(self, *keys: str) -> None:
+        """Invalidate cached payloads."""
+        if self._redis is not None:
+            try:
+                await self._redis.delete(*keys)
+            except RedisError as e:
+                logger.warning("Response cache delete failed for %s: %s", keys, e)
+        else:
+            for key in keys:
+                self._local.pop(key, None)
+    
+    async def close(self) -> None:
+        """Close the Redis connection, if any."""
+        if self._redis is not None:
+            await self._redis.close()
+
+
+response_cache = ResponseCache()
+
+
 # Mock data (in real implementation, this would come from database)
-mock_users = []
-mock_learning_paths = []
-mock_tutorials = []
-mock_exercises = []
+# Users are keyed by username, content by id, so lookups are O(1)
+mock_users: Dict[str, User] = {}
+mock_user_emails: set = set()
+mock_password_hashes: Dict[str, bytes] = {}
+mock_access_tokens: Dict[str, Dict[str, Any]] = {}
+mock_submissions: Dict[int, Dict[str, Any]] = {}
+submission_ids = itertools.count(1)
+mock_learning_paths: Dict[int, Dict[str, Any]] = {}
+mock_tutorials: Dict[int, Dict[str, Any]] = {}
+mock_exercises: Dict[int, Dict[str, Any]] = {}
+
+# Secondary indexes for filtered listings
+tutorials_by_learning_path: Dict[int, List[Dict[str, Any]]] = {}
+exercises_by_tutorial: Dict[int, List[Dict[str, Any]]] = {}
+
+# Static analytics payload (in real implementation, computed per user)
+MOCK_LEARNING_STATS_JSON = orjson.dumps({
+    "total_learning_hours": 156,
+    "tutorials_completed": 12,
+    "exercises_solved": 48,
+    "average_score": 82.5,
+    "streak_days": 7,
+    "weekly_progress": [
+        {"week": "2024-W1", "hours": 8},
+        {"week": "2024-W2", "hours": 12},
+        {"week": "2024-W3", "hours": 15},
+        {"week": "2024-W4", "hours": 10},
+    ],
+    "skill_progress": {
+        "ai_fundamentals": 90,
+        "technical_limitations": 65,
+        "solutions": 40,
+        "implementation": 30,
+    }
+})
+
+# Pre-serialized listing payloads, rebuilt whenever content is loaded
+learning_paths_json = b"[]"
+tutorials_json = b"[]"
+exercises_json = b"[]"
+tutorials_json_by_learning_path: Dict[int, bytes] = {}
+exercises_json_by_tutorial: Dict[int, bytes] = {}
+tutorials_with_exercises_json_by_learning_path: Dict[int, bytes] = {}
+
+
+def group_by(items, key: str) -> Dict[int, List[Dict[str, Any]]]:
+    """Group content items by the value of a foreign-key field."""
+    groups: Dict[int, List[Dict[str, Any]]] = {}
+    for item in items:
+        groups.setdefault(item[key], []).append(item)
+    return groups
 
 
 async def initialize_database():
@@ -193,7 +354,7 @@ async def initialize_database():
         # Placeholder for database initialization
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e)
         raise
 
 
@@ -201,8 +362,8 @@ async def load_content_data():
     """Load initial content data."""
     try:
         # Load learning paths
-        global mock_learning_paths
-        mock_learning_paths = [
+        global mock_learning_paths, tutorials_by_learning_path, exercises_by_tutorial
+        learning_paths = [
             {
                 "id": 1,
                 "title": "Foundational Path",
@@ -237,38 +398,94 @@ async def load_content_data():
                 "is_active": True,
             },
         ]
+        mock_learning_paths = {p["id"]: p for p in learning_paths}
+        
+        # Build secondary indexes
+        tutorials_by_learning_path = group_by(mock_tutorials.values(), "learning_path_id")
+        exercises_by_tutorial = group_by(mock_exercises.values(), "tutorial_id")
+        
+        serialize_content()
         
         logger.info("Content data loaded successfully")
     except Exception as e:
-        logger.error(f"Content loading failed: {e}")
+        logger.error("Content loading failed: %s", e)
+
+
+def serialize_content():
+    """Serialize listing payloads once so read endpoints can return raw bytes."""
+    global learning_paths_json, tutorials_json, exercises_json
+    global tutorials_json_by_learning_path, exercises_json_by_tutorial
+    global tutorials_with_exercises_json_by_learning_path
+    learning_paths_json = orjson.dumps(list(mock_learning_paths.values()))
+    tutorials_json = orjson.dumps(list(mock_tutorials.values()))
+    exercises_json = orjson.dumps(list(mock_exercises.values()))
+    tutorials_json_by_learning_path = {
+        path_id: orjson.dumps(tutorials)
+        for path_id, tutorials in tutorials_by_learning_path.items()
+    }
+    exercises_json_by_tutorial = {
+        tutorial_id: orjson.dumps(exercises)
+        for tutorial_id, exercises in exercises_by_tutorial.items()
+    }
+    tutorials_with_exercises_json_by_learning_path = {
+        path_id: orjson.dumps([
+            {**tutorial, "exercises": exercises_by_tutorial.get(tutorial["id"], [])}
+            for tutorial in tutorials
+        ])
+        for path_id, tutorials in tutorials_by_learning_path.items()
+    }
+
+
+def json_bytes_response(content: bytes) -> Response:
+    """Wrap pre-serialized JSON in a response without re-encoding it."""
+    return Response(content=content, media_type="application/json")
 
 
 async def cleanup_resources():
     """Cleanup resources on shutdown."""
     try:
         # Cleanup database connections
+        await response_cache.close()
         logger.info("Resources cleaned up successfully")
     except Exception as e:
-        logger.error(f"Resource cleanup failed: {e}")
+        logger.error("Resource cleanup failed: %s", e)
 
 
 # Authentication utilities
-def create_access_token(data: dict, expires_delta: Optional[int] = None):
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token."""
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        expire = datetime.utcnow() + ACCESS_TOKEN_EXPIRE
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def get_access_token(username: str) -> str:
+    """Return the user's cached access token, issuing a new one near expiry."""
+    now = datetime.utcnow()
+    cached = mock_access_tokens.get(username)
+    if cached is not None and cached["exp"] - now > TOKEN_REUSE_MIN_LIFETIME:
+        return cached["token"]
+    
+    token = create_access_token(data={"sub": username}, expires_delta=ACCESS_TOKEN_EXPIRE)
+    mock_access_tokens[username] = {"token": token, "exp": now + ACCESS_TOKEN_EXPIRE}
+    return token
+
+
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify JWT token."""
+    token_key = hashlib.sha256(credentials.credentials.encode()).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(token_key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+    
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(credentials.credentials, VERIFY_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             raise HTTPException(
@@ -276,6 +493,10 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        expires_at = payload.get("exp")
+        if expires_at is not None:
+            with _token_cache_lock:
+                _token_cache[token_key] = (username, expires_at)
         return username
     except jwt.PyJWTError:
         raise HTTPException(
@@ -288,32 +509,77 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
 def get_current_user(username: str = Depends(verify_token)):
     """Get current user from token."""
     # In real implementation, fetch from database
-    user = next((user for user in mock_users if user.username == username), None)
+    user = mock_users.get(username)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
+# Pre-serialized status payloads
+ROOT_JSON = orjson.dumps({
+    "message": "Claw Son Education Platform API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health"
+})
+HEALTH_REFRESH_INTERVAL = 1.0
+
+
+def build_health_json() -> bytes:
+    """Serialize the health payload with the current timestamp."""
+    return orjson.dumps({
+        "status": "healthy",
+        "version": "1.0.0",
+        "timestamp": datetime.utcnow()
+    })
+
+
+health_json = build_health_json()
+
+
+async def refresh_health_json():
+    """Keep the cached health payload's timestamp current."""
+    global health_json
+    while True:
+        health_json = build_health_json()
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+
+
 # API Routes
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Claw Son Education Platform API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return json_bytes_response(ROOT_JSON)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return json_bytes_response(health_json)
+
+
+@lru_cache(maxsize=1)
+def openapi_schema_json() -> bytes:
+    """Serialize the OpenAPI schema once, on first request."""
+    return orjson.dumps(app.openapi())
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def get_openapi_schema():
+    """OpenAPI schema, serialized once and served as cached bytes."""
+    return json_bytes_response(openapi_schema_json())
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    """Swagger UI documentation."""
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc():
+    """ReDoc documentation."""
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
 
 
 # Authentication endpoints
@@ -321,11 +587,13 @@ async def health_check():
 async def register(user: UserCreate):
     """Register a new user."""
     # Check if user already exists
-    if any(u.username == user.username or u.email == user.email for u in mock_users):
+    if user.username in mock_users or user.email in mock_user_emails:
         raise HTTPException(status_code=400, detail="User already exists")
     
     # Hash password
-    hashed_password = pwd_context.hash(user.password)
+    hashed_password = await run_in_threadpool(
+        bcrypt.hashpw, user.password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    )
     
     # Create user
     new_user = User(
@@ -336,10 +604,12 @@ async def register(user: UserCreate):
     )
     
     # Store user (in real implementation, save to database)
-    mock_users.append(new_user)
+    mock_users[new_user.username] = new_user
+    mock_user_emails.add(new_user.email)
+    mock_password_hashes[new_user.username] = hashed_password
     
     # Create access token
-    access_token = create_access_token(data={"sub": new_user.username})
+    access_token = get_access_token(new_user.username)
     
     return {
         "access_token": access_token,
@@ -357,17 +627,20 @@ async def register(user: UserCreate):
 async def login(user_credentials: UserLogin):
     """Authenticate user and return token."""
     # Find user (in real implementation, verify with database)
-    user = next((u for u in mock_users if u.username == user_credentials.username), None)
+    user = mock_users.get(user_credentials.username)
     
-    if not user:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    # Verify password off the event loop; unknown users are checked against a
+    # dummy hash so both failure paths cost the same
+    hashed_password = mock_password_hashes.get(user_credentials.username, DUMMY_PASSWORD_HASH)
+    password_valid = await run_in_threadpool(
+        bcrypt.checkpw, user_credentials.password.encode(), hashed_password
+    )
     
-    # Verify password (in real implementation, verify hashed password)
-    # if not pwd_context.verify(user_credentials.password, user.hashed_password):
-    #     raise HTTPException(status_code=401, detail="Invalid credentials")
+    if user is None or not password_valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Create access token
-    access_token = create_access_token(data={"sub": user.username})
+    access_token = get_access_token(user.username)
     
     return {
         "access_token": access_token,
@@ -382,54 +655,67 @@ async def login(user_credentials: UserLogin):
 
 
 # Learning paths endpoints
-@app.get("/learning-paths", response_model=List[LearningPath])
+@app.get("/learning-paths", responses={200: {"model": List[LearningPath]}})
 async def get_learning_paths():
     """Get all learning paths."""
-    return mock_learning_paths
+    return json_bytes_response(learning_paths_json)
 
 
-@app.get("/learning-paths/{path_id}", response_model=LearningPath)
+@app.get("/learning-paths/{path_id}", responses={200: {"model": LearningPath}})
 async def get_learning_path(path_id: int):
     """Get specific learning path."""
-    path = next((p for p in mock_learning_paths if p["id"] == path_id), None)
+    path = mock_learning_paths.get(path_id)
     if not path:
         raise HTTPException(status_code=404, detail="Learning path not found")
     return path
 
 
+@app.get("/learning-paths/{path_id}/tutorials")
+async def get_tutorials_with_exercises(path_id: int):
+    """Get a learning path's tutorials with their exercises embedded."""
+    # In real implementation, load in a single query rather than one per tutorial:
+    # db.query(Tutorial).options(selectinload(Tutorial.exercises))
+    #     .filter(Tutorial.learning_path_id == path_id).all()
+    if path_id not in mock_learning_paths:
+        raise HTTPException(status_code=404, detail="Learning path not found")
+    return json_bytes_response(
+        tutorials_with_exercises_json_by_learning_path.get(path_id, b"[]")
+    )
+
+
 # Tutorials endpoints
-@app.get("/tutorials", response_model=List[Tutorial])
+@app.get("/tutorials", responses={200: {"model": List[Tutorial]}})
 async def get_tutorials(learning_path_id: Optional[int] = None):
     """Get tutorials, optionally filtered by learning path."""
-    tutorials = mock_tutorials
     if learning_path_id:
-        tutorials = [t for t in tutorials if t["learning_path_id"] == learning_path_id]
-    return tutorials
+        return json_bytes_response(
+            tutorials_json_by_learning_path.get(learning_path_id, b"[]")
+        )
+    return json_bytes_response(tutorials_json)
 
 
-@app.get("/tutorials/{tutorial_id}", response_model=Tutorial)
+@app.get("/tutorials/{tutorial_id}", responses={200: {"model": Tutorial}})
 async def get_tutorial(tutorial_id: int):
     """Get specific tutorial."""
-    tutorial = next((t for t in mock_tutorials if t["id"] == tutorial_id), None)
+    tutorial = mock_tutorials.get(tutorial_id)
     if not tutorial:
         raise HTTPException(status_code=404, detail="Tutorial not found")
     return tutorial
 
 
 # Exercises endpoints
-@app.get("/exercises", response_model=List[Exercise])
+@app.get("/exercises", responses={200: {"model": List[Exercise]}})
 async def get_exercises(tutorial_id: Optional[int] = None):
     """Get exercises, optionally filtered by tutorial."""
-    exercises = mock_exercises
     if tutorial_id:
-        exercises = [e for e in exercises if e["tutorial_id"] == tutorial_id]
-    return exercises
+        return json_bytes_response(exercises_json_by_tutorial.get(tutorial_id, b"[]"))
+    return json_bytes_response(exercises_json)
 
 
-@app.get("/exercises/{exercise_id}", response_model=Exercise)
+@app.get("/exercises/{exercise_id}", responses={200: {"model": Exercise}})
 async def get_exercise(exercise_id: int):
     """Get specific exercise."""
-    exercise = next((e for e in mock_exercises if e["id"] == exercise_id), None)
+    exercise = mock_exercises.get(exercise_id)
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
     return exercise
@@ -443,7 +729,8 @@ async def update_progress(
 ):
     """Update user progress."""
     # In real implementation, save to database
-    logger.info(f"Updated progress for user {current_user.id}: {progress}")
+    logger.info("Updated progress for user %s: %s", current_user.username, progress)
+    await response_cache.delete(f"progress:{current_user.id}", f"stats:{current_user.username}")
     return {"status": "success", "message": "Progress updated"}
 
 
@@ -458,7 +745,12 @@ async def get_user_progress(
     if current_user.id != user_id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Access denied")
     
-    return {
+    cache_key = f"progress:{user_id}"
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return json_bytes_response(cached)
+    
+    progress = orjson.dumps({
         "user_id": user_id,
         "completed_tutorials": 12,
         "total_hours": 156,
@@ -468,36 +760,68 @@ async def get_user_progress(
             {"id": 1, "title": "AI Basics", "earned_at": "2024-01-15"},
             {"id": 2, "title": "First Exercise", "earned_at": "2024-01-16"},
         ]
-    }
+    })
+    await response_cache.set(cache_key, progress)
+    return json_bytes_response(progress)
 
 
 # Assessment endpoints
-@app.post("/assessments/{assessment_id}/submit")
-async def submit_assessment(
-    assessment_id: int,
-    submission: AssessmentSubmission,
-    current_user: User = Depends(get_current_user)
-):
-    """Submit assessment for grading."""
+def grade_submission(submission_id: int):
+    """Grade a queued assessment submission."""
     # In real implementation:
-    # 1. Save submission to database
-    # 2. Run automated grading
-    # 3. Calculate score and provide feedback
-    # 4. Update user progress
-    
-    logger.info(f"Assessment {assessment_id} submitted by user {current_user.id}")
+    # 1. Run automated grading
+    # 2. Calculate score and provide feedback
+    # 3. Update user progress
+    submission = mock_submissions[submission_id]
     
     # Mock grading result
     score = 85.0
-    passed = score >= 70.0
-    
-    return {
-        "submission_id": 1,
+    submission.update({
+        "status": "graded",
         "score": score,
-        "passed": passed,
+        "passed": score >= 70.0,
         "feedback": "Good work! Review the questions you missed for improvement.",
-        "graded_at": datetime.utcnow().isoformat()
+        "graded_at": datetime.utcnow()
+    })
+    logger.info("Graded submission %s", submission_id)
+
+
+@app.post("/assessments/{assessment_id}/submit", status_code=status.HTTP_202_ACCEPTED)
+async def submit_assessment(
+    assessment_id: int,
+    submission: AssessmentSubmission,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
+):
+    """Queue an assessment submission for grading."""
+    # In real implementation, save submission to database
+    submission_id = next(submission_ids)
+    mock_submissions[submission_id] = {
+        "submission_id": submission_id,
+        "assessment_id": assessment_id,
+        "user_id": current_user.id,
+        "username": current_user.username,
+        "status": "queued"
     }
+    
+    logger.info("Assessment %s submitted by user %s", assessment_id, current_user.id)
+    background_tasks.add_task(grade_submission, submission_id)
+    
+    return {"submission_id": submission_id, "status": "queued"}
+
+
+@app.get("/submissions/{submission_id}")
+async def get_submission(
+    submission_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the status and, once graded, the result of a submission."""
+    submission = mock_submissions.get(submission_id)
+    if submission is None:
+        raise HTTPException(status_code=404, detail="Submission not found")
+    if current_user.username != submission["username"] and current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Access denied")
+    return submission
 
 
 # Analytics endpoints
@@ -506,33 +830,23 @@ async def get_learning_stats(
     current_user: User = Depends(get_current_user)
 ):
     """Get learning analytics for current user."""
-    return {
-        "total_learning_hours": 156,
-        "tutorials_completed": 12,
-        "exercises_solved": 48,
-        "average_score": 82.5,
-        "streak_days": 7,
-        "weekly_progress": [
-            {"week": "2024-W1", "hours": 8},
-            {"week": "2024-W2", "hours": 12},
-            {"week": "2024-W3", "hours": 15},
-            {"week": "2024-W4", "hours": 10},
-        ],
-        "skill_progress": {
-            "ai_fundamentals": 90,
-            "technical_limitations": 65,
-            "solutions": 40,
-            "implementation": 30,
-        }
-    }
+    cache_key = f"stats:{current_user.username}"
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return json_bytes_response(cached)
+    
+    # In real implementation, compute from the user's activity
+    stats = MOCK_LEARNING_STATS_JSON
+    await response_cache.set(cache_key, stats)
+    return json_bytes_response(stats)
 
 
 # Exception handlers
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=500,
         content={"message": "Internal server error", "detail": str(exc)}
     )
@@ -546,9 +860,19 @@ def main():
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
-    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    # Each worker generates its own ephemeral key without JWT_PRIVATE_KEY, so
+    # tokens would only verify on the worker that issued them
+    signing_key_configured = bool(os.getenv("JWT_PRIVATE_KEY"))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, os.cpu_count() or 1) if signing_key_configured else 1,
+        help="Number of worker processes (defaults to CPU count when JWT_PRIVATE_KEY is set, else 1)"
+    )
     
     args = parser.parse_args()
+    if args.workers > 1 and not signing_key_configured:
+        parser.error("--workers > 1 requires JWT_PRIVATE_KEY so all workers share one signing key")
     
     uvicorn.run(
         "src.main:app",
@@ -556,6 +880,8 @@ def main():
         port=args.port,
         reload=args.reload,
         workers=args.workers if not args.reload else 1,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
 
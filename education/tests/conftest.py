@@ -0,0 +1,40 @@
+"""
+Shared fixtures for the education platform backend tests.
+"""
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+import pytest
+
+# Cheap password hashing for tests; read when the backend module is imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "platform" / "backend"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src import main  # noqa: E402
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    """Test client with the application lifespan running."""
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def register_user(client: TestClient):
+    """Register a fresh user and return its username and bearer auth headers."""
+    def _register() -> Tuple[str, Dict[str, str]]:
+        username = f"user_{uuid.uuid4().hex[:8]}"
+        response = client.post("/auth/register", json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": "correct-horse-battery-staple",
+        })
+        assert response.status_code == 200
+        return username, {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return _register
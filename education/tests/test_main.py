@@ -0,0 +1,96 @@
+"""
+Tests for the education platform backend API.
+"""
+import asyncio
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from src import main
+
+
+def submit(client: TestClient, headers, assessment_id: int = 1) -> int:
+    """Submit an assessment and return the submission ID."""
+    response = client.post(
+        f"/assessments/{assessment_id}/submit",
+        headers=headers,
+        json={
+            "assessment_id": assessment_id,
+            "user_id": 0,
+            "answers": [{"question_id": 1, "answer": "a"}],
+            "submitted_at": datetime.utcnow().isoformat(),
+        },
+    )
+    assert response.status_code == 202
+    return response.json()["submission_id"]
+
+
+class TestSubmissions:
+    """Tests for assessment submission access."""
+
+    def test_owner_can_read_submission(self, client, register_user):
+        _, owner = register_user()
+        submission_id = submit(client, owner)
+
+        response = client.get(f"/submissions/{submission_id}", headers=owner)
+
+        assert response.status_code == 200
+        assert response.json()["submission_id"] == submission_id
+
+    def test_non_owner_is_denied(self, client, register_user):
+        (_, owner), (_, other) = register_user(), register_user()
+        submission_id = submit(client, owner)
+
+        response = client.get(f"/submissions/{submission_id}", headers=other)
+
+        assert response.status_code == 403
+
+
+class TestOpenAPI:
+    """Tests for the cached OpenAPI schema."""
+
+    def test_schema_served_without_lifespan(self):
+        response = TestClient(main.app).get("/openapi.json")
+
+        assert response.status_code == 200
+        assert response.json()["info"]["title"] == main.app.title
+
+
+class TestResponseCache:
+    """Tests for response cache failure handling."""
+
+    def test_redis_errors_degrade_to_misses(self):
+        cache = main.ResponseCache("redis://127.0.0.1:1/0")
+
+        async def exercise():
+            await cache.set("key", b"value")
+            await cache.delete("key")
+            return await cache.get("key")
+
+        assert asyncio.run(exercise()) is None
+
+
+class TestLearningStats:
+    """Tests for per-user learning stats caching."""
+
+    def test_stats_are_cached_and_invalidated_per_user(self, client, register_user):
+        (alice, alice_headers), (bob, bob_headers) = register_user(), register_user()
+        cache = main.response_cache._local
+
+        assert client.get("/analytics/learning-stats", headers=alice_headers).status_code == 200
+        assert client.get("/analytics/learning-stats", headers=bob_headers).status_code == 200
+        assert f"stats:{alice}" in cache
+        assert f"stats:{bob}" in cache
+
+        response = client.post("/progress", headers=alice_headers, json={
+            "user_id": 0,
+            "content_id": 1,
+            "content_type": "tutorial",
+            "progress_percentage": 50.0,
+            "is_completed": False,
+            "last_accessed": datetime.utcnow().isoformat(),
+        })
+
+        assert response.status_code == 200
+        assert f"stats:{alice}" not in cache
+        assert f"stats:{bob}" in cache
@@ -6,9 +6,10 @@ for all models, pipelines, and components in the system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
 
 
 class BaseModel(ABC):
@@ -40,28 +41,73 @@ class BaseModel(ABC):
         pass
     
     @abstractmethod
-    def predict(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+    def predict(self, X: Union[np.ndarray, pd.DataFrame], *, 
+                batch_size: int = 1024, dtype: DTypeLike = np.float32) -> np.ndarray:
         """Make predictions on new data.
         
+        Implementations should convert X to ``dtype`` once and process it in
+        contiguous slices of ``batch_size`` rows (see ``_iter_batches``) rather
+        than row by row, so inference stays vectorized.
+        
         Args:
             X: Input features
+            batch_size: Number of rows per inference batch
+            dtype: Input dtype to convert X to before inference
             
         Returns:
             Predictions
         """
         pass
     
-    def predict_proba(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+    def predict_proba(self, X: Union[np.ndarray, pd.DataFrame], *, 
+                      batch_size: int = 1024, dtype: DTypeLike = np.float32) -> np.ndarray:
         """Predict class probabilities (for classification tasks).
         
         Args:
             X: Input features
+            batch_size: Number of rows per inference batch
+            dtype: Input dtype to convert X to before inference
             
         Returns:
             Class probabilities
         """
         raise NotImplementedError("Probability prediction not implemented")
     
+    def predict_bf16(self, X: Union[np.ndarray, pd.DataFrame], *, 
+                     batch_size: int = 1024) -> np.ndarray:
+        """Make predictions with bfloat16 inputs.
+        
+        Optional override for models that can run on BF16-capable CPUs
+        (AVX-512 BF16, AMX), typically via ``ml_dtypes.bfloat16``.
+        
+        Args:
+            X: Input features
+            batch_size: Number of rows per inference batch
+            
+        Returns:
+            Predictions
+        """
+        raise NotImplementedError("bfloat16 prediction not implemented")
+    
+    @staticmethod
+    def _iter_batches(X: Union[np.ndarray, pd.DataFrame], batch_size: int = 1024, 
+                      dtype: DTypeLike = np.float32) -> Iterator[np.ndarray]:
+        """Yield contiguous row slices of X, converted to dtype once.
+        
+        Args:
+            X: Input features
+            batch_size: Number of rows per slice
+            dtype: Dtype to convert X to
+            
+        Returns:
+            Iterator over row slices
+        """
+        if isinstance(X, pd.DataFrame):
+            X = X.values
+        X = np.ascontiguousarray(X, dtype=dtype)
+        for start in range(0, X.shape[0], batch_size):
+            yield X[start:start + batch_size]
+    
     @abstractmethod
     def explain(self, X: Union[np.ndarray, pd.DataFrame]) -> Dict[str, Any]:
         """Provide explanation for predictions.
@@ -128,8 +174,10 @@ class BasePipeline(ABC):
             config: Pipeline configuration dictionary
         """
         self.config = config
-        self.steps = []
+        self.steps: Union[List[Any], Tuple[Any, ...]] = []
         self.is_fitted = False
+        self._params_cache: Optional[Dict[str, Any]] = None
+        self._compiled_transform: Optional[Callable[[Any], Any]] = None
     
     @abstractmethod
     def fit(self, X: Union[np.ndarray, pd.DataFrame], 
@@ -158,17 +206,93 @@ class BasePipeline(ABC):
         pass
     
     def fit_transform(self, X: Union[np.ndarray, pd.DataFrame], 
-                     y: Optional[Union[np.ndarray, pd.DataFrame]] = None) -> Union[np.ndarray, pd.DataFrame]:
+                     y: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+                     out: Optional[np.ndarray] = None) -> Union[np.ndarray, pd.DataFrame]:
         """Fit pipeline and transform data.
         
+        The default implementation fits and then transforms, reading X twice.
+        For large X, override to compute running statistics (mean/var/min/max)
+        and emit transformed rows in a single pass over X; this halves memory
+        bandwidth vs. fit-then-transform.
+        
         Args:
             X: Input data
             y: Optional targets
+            out: Optional preallocated array to write the result into
             
         Returns:
-            Transformed data
+            Transformed data (``out`` when provided)
+        """
+        return self._default_fit_transform(X, y, out=out)
+    
+    def _default_fit_transform(self, X: Union[np.ndarray, pd.DataFrame], 
+                               y: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+                               out: Optional[np.ndarray] = None) -> Union[np.ndarray, pd.DataFrame]:
+        """Fit then transform as two separate passes over X."""
+        transformed = self.fit(X, y).transform(X)
+        if out is None:
+            return transformed
+        np.copyto(out, transformed)
+        return out
+    
+    def _finalize_fit(self) -> 'BasePipeline':
+        """Freeze steps into a tuple and mark the pipeline fitted.
+        
+        Implementations should return this from ``fit``.
+        
+        Returns:
+            Self for method chaining
+        """
+        self.steps = tuple(self.steps)
+        self.is_fitted = True
+        self._invalidate_caches()
+        return self
+    
+    def _invalidate_caches(self) -> None:
+        """Drop memoized params and the compiled transform.
+        
+        Implementations should call this from ``set_params`` so both are
+        rebuilt on next use; it leaves ``is_fitted`` untouched.
+        """
+        self._params_cache = None
+        self._compiled_transform = None
+    
+    def get_cached_params(self) -> Dict[str, Any]:
+        """Get pipeline parameters, memoized once steps are frozen.
+        
+        Returns:
+            Dictionary of parameters
         """
-        return self.fit(X, y).transform(X)
+        if not isinstance(self.steps, tuple):
+            return self.get_params()
+        if self._params_cache is None:
+            self._params_cache = self.get_params()
+        return self._params_cache
+    
+    def compile(self) -> Callable[[Any], Any]:
+        """Generate a straight-line transform for the frozen step sequence.
+        
+        Steps are either transformers or ``(name, transformer)`` pairs. The
+        generated function calls each step's ``transform`` in order, avoiding
+        per-step loop dispatch for pipelines with many cheap steps.
+        
+        Returns:
+            Function mapping input data to transformed data
+        """
+        if not self.is_fitted:
+            raise ValueError("Pipeline must be fitted before compiling")
+        compiled = self._compiled_transform
+        if compiled is None:
+            namespace: Dict[str, Any] = {
+                f"_step{i}": step[1] if isinstance(step, tuple) else step
+                for i, step in enumerate(self.steps)
+            }
+            body = "".join(f"    X = {name}.transform(X)\n" for name in namespace)
+            source = f"def _compiled_transform(X):\n{body}    return X\n"
+            # Source is generated from fixed templates, never from user input
+            exec(source, namespace)  # nosec B102
+            compiled = self._compiled_transform = namespace["_compiled_transform"]
+        return compiled
     
     @abstractmethod
     def get_params(self) -> Dict[str, Any]:
@@ -218,6 +342,24 @@ class BaseReasoner(ABC):
         """
         pass
     
+    def reason_batch(self, features: np.ndarray, query: str) -> np.ndarray:
+        """Perform reasoning on a batch of feature rows.
+        
+        The default calls ``reason`` once per row; override with a vectorized
+        implementation to avoid per-row Python overhead.
+        
+        Args:
+            features: Feature matrix of shape (batch, n_features)
+            query: Reasoning query
+            
+        Returns:
+            Array of per-row symbolic features of shape (batch, output_size)
+        """
+        return np.stack([
+            np.asarray(self.reason(facts=[{"features": row}], query=query)["features"])
+            for row in features
+        ])
+    
     @abstractmethod
     def add_knowledge(self, knowledge: Dict[str, Any]) -> None:
         """Add knowledge to the reasoning system.
@@ -336,6 +478,50 @@ class BaseDataProcessor(ABC):
         """
         return self.fit(X).transform(X)
     
+    def transform_columns(self, X: pd.DataFrame, cols: List[str]) -> Dict[str, np.ndarray]:
+        """Transform selected columns in structure-of-arrays form.
+        
+        Prefer this over ``transform`` when only a few columns change. Each
+        column is handled as its own contiguous array (see ``_column_arrays``)
+        so NumPy ufuncs run as plain SIMD loops, and untouched columns are
+        never copied into a 2D array via ``.values``.
+        
+        Args:
+            X: Data to transform
+            cols: Names of columns to transform
+            
+        Returns:
+            Dictionary mapping column name to transformed array
+        """
+        raise NotImplementedError("Columnar transform not implemented")
+    
+    def transform_frame(self, X: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+        """Apply ``transform_columns`` and reassemble the result into a DataFrame.
+        
+        Args:
+            X: Data to transform
+            cols: Names of columns to transform
+            
+        Returns:
+            Copy of X with the transformed columns replaced
+        """
+        return X.assign(**self.transform_columns(X, cols))
+    
+    @staticmethod
+    def _column_arrays(X: pd.DataFrame, cols: List[str], 
+                       dtype: DTypeLike = np.float32) -> Dict[str, np.ndarray]:
+        """Extract columns as contiguous per-column arrays.
+        
+        Args:
+            X: Source data
+            cols: Names of columns to extract
+            dtype: Dtype of the extracted arrays
+            
+        Returns:
+            Dictionary mapping column name to contiguous array
+        """
+        return {col: np.ascontiguousarray(X[col].to_numpy(), dtype=dtype) for col in cols}
+    
     @abstractmethod
     def inverse_transform(self, X: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
         """Inverse transform data.
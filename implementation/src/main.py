@@ -5,17 +5,22 @@ This module serves as the entry point for the AI solutions platform,
 providing REST APIs for model serving, experiment tracking, and system management.
 """
 
+import hashlib
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +53,7 @@ app = FastAPI(
     description="AI Solutions Platform for Addressing AI Limitations",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -60,12 +66,16 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Level 1 compresses JSON nearly as well as the default level 9 at a fraction of the CPU;
+# payloads under 500 bytes are left alone since compression barely helps them
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
 
 
 # Pydantic models
 class HealthCheck(BaseModel):
     """Health check response model."""
+    model_config = ConfigDict(frozen=True)
+    
     status: str
     version: str
     components: Dict[str, str]
@@ -80,14 +90,194 @@ class PredictionRequest(BaseModel):
 
 class PredictionResponse(BaseModel):
     """Prediction response model."""
+    model_config = ConfigDict(frozen=True)
+    
     prediction: Any
     confidence: float
-    explanation: str = None
+    explanation: Optional[str] = None
     model_version: str
 
 
+# Static payloads, serialized once at import
+_ROOT_JSON = orjson.dumps({
+    "message": "Claw Son Four Point Five - AI Solutions Platform",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "health": "/health"
+})
+
+_MODELS_JSON = orjson.dumps({
+    "models": [
+        {
+            "name": "neuro_symbolic_classifier",
+            "type": "hybrid",
+            "description": "Neuro-symbolic classification model",
+            "version": "1.0.0"
+        },
+        {
+            "name": "explainable_regressor",
+            "type": "interpretable",
+            "description": "Explainable regression model",
+            "version": "1.0.0"
+        },
+        {
+            "name": "robust_classifier",
+            "type": "robust",
+            "description": "Adversarially robust classifier",
+            "version": "1.0.0"
+        }
+    ]
+})
+
+_EXPERIMENTS_JSON = orjson.dumps({
+    "experiments": [
+        {
+            "id": "exp_001",
+            "name": "Neuro-Symbolic Integration Study",
+            "status": "completed",
+            "created_at": "2024-01-15T10:00:00Z",
+            "metrics": {"accuracy": 0.92, "explainability": 0.85}
+        },
+        {
+            "id": "exp_002",
+            "name": "Robustness Evaluation",
+            "status": "running",
+            "created_at": "2024-01-16T14:30:00Z",
+            "metrics": None
+        }
+    ]
+})
+
+_LIMITATIONS_JSON = orjson.dumps({
+    "limitations_addressed": [
+        {
+            "name": "Common Sense Gaps",
+            "solutions": ["neuro_symbolic_integration", "knowledge_grounding"],
+            "status": "in_development"
+        },
+        {
+            "name": "Explainability",
+            "solutions": ["intrinsic_explainability", "post_hoc_explanations"],
+            "status": "implemented"
+        },
+        {
+            "name": "Robustness",
+            "solutions": ["adversarial_training", "uncertainty_quantification"],
+            "status": "testing"
+        }
+    ]
+})
+
+
+def json_etag(content: bytes) -> str:
+    """Compute a weak ETag for a pre-serialized payload.
+    
+    The tag is weak because GZipMiddleware may re-encode the body, so the
+    bytes on the wire are not always the bytes that were hashed.
+    """
+    return 'W/"%s"' % hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+_MODELS_ETAG = json_etag(_MODELS_JSON)
+_EXPERIMENTS_ETAG = json_etag(_EXPERIMENTS_JSON)
+_LIMITATIONS_ETAG = json_etag(_LIMITATIONS_JSON)
+
+
+def json_bytes_response(content: bytes) -> Response:
+    """Wrap pre-serialized JSON in a response without re-encoding it."""
+    return Response(content=content, media_type="application/json")
+
+
+def numpy_json_response(content: Any) -> Response:
+    """Serialize a payload that may hold numpy arrays, such as model explanations.
+    
+    Returning such a payload from a route would run it through jsonable_encoder,
+    which rejects ndarrays; orjson encodes them natively instead.
+    """
+    return json_bytes_response(orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+    
+    Uses the weak comparison RFC 9110 requires for If-None-Match: a ``W/``
+    prefix on either side is ignored, so validators weakened by proxies or
+    compression still match.
+    
+    Args:
+        if_none_match: Raw If-None-Match header value (``*`` or a tag list)
+        etag: ETag of the current representation
+        
+    Returns:
+        Whether the client's cached representation is current
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+def cached_json_response(request: Request, content: bytes, etag: str) -> Response:
+    """Serve static JSON with an ETag, answering 304 when the client's copy matches.
+    
+    Args:
+        request: Incoming request carrying the optional If-None-Match header
+        content: Pre-serialized JSON body
+        etag: ETag of content
+        
+    Returns:
+        Empty 304 response on a match, otherwise the full JSON response
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=60",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=128)
+def _explain_json(model_name: str) -> Tuple[bytes, str]:
+    """Serialize the explanation-capabilities payload for a model with its ETag."""
+    content = orjson.dumps({
+        "model": model_name,
+        "explanation_methods": [
+            "shap",
+            "lime",
+            "attention_weights",
+            "feature_importance"
+        ],
+        "intrinsic_explainability": True,
+        "post_hoc_explanations": True
+    })
+    return content, json_etag(content)
+
+
+# Health responses for each (database, ml_components) state, built once
+# without validation since every field is server-produced
+_HEALTH_RESPONSES = {
+    (database_ok, ml_ok): HealthCheck.model_construct(
+        status="healthy",
+        version="0.1.0",
+        components={
+            "database": "healthy" if database_ok else "unhealthy",
+            "ml_components": "healthy" if ml_ok else "unhealthy"
+        }
+    )
+    for database_ok in (True, False)
+    for ml_ok in (True, False)
+}
+
+
 # Global variables for components
-ml_components = {}
+# Read-only registry of loaded models, rebuilt wholesale rather than mutated
+ml_components = MappingProxyType({})
 database_connection = None
 
 
@@ -108,7 +298,10 @@ async def initialize_ml_components():
     global ml_components
     try:
         # Load models and initialize ML components
-        # ml_components = await load_models()
+        loaded = {}  # await load_models()
+        ml_components = MappingProxyType(
+            {sys.intern(name): model for name, model in loaded.items()}
+        )
         logger.info("ML components initialized successfully")
     except Exception as e:
         logger.error(f"ML components initialization failed: {e}")
@@ -125,79 +318,44 @@ async def cleanup_resources():
             logger.info("Database connection closed")
         
         # Cleanup ML components
-        ml_components.clear()
+        ml_components = MappingProxyType({})
         logger.info("ML components cleaned up")
     except Exception as e:
         logger.error(f"Resource cleanup failed: {e}")
 
 
 # API Routes
-@app.get("/", response_model=Dict[str, str])
+@app.get("/", responses={200: {"model": Dict[str, str]}})
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Claw Son Four Point Five - AI Solutions Platform",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return json_bytes_response(_ROOT_JSON)
 
 
 @app.get("/health", response_model=HealthCheck)
 async def health_check():
     """Health check endpoint."""
-    return HealthCheck(
-        status="healthy",
-        version="0.1.0",
-        components={
-            "database": "healthy" if database_connection else "unhealthy",
-            "ml_components": "healthy" if ml_components else "unhealthy"
-        }
-    )
+    return _HEALTH_RESPONSES[(bool(database_connection), bool(ml_components))]
 
 
 @app.get("/models")
-async def list_models():
+async def list_models(request: Request):
     """List available models."""
     # Placeholder for model listing
-    return {
-        "models": [
-            {
-                "name": "neuro_symbolic_classifier",
-                "type": "hybrid",
-                "description": "Neuro-symbolic classification model",
-                "version": "1.0.0"
-            },
-            {
-                "name": "explainable_regressor",
-                "type": "interpretable",
-                "description": "Explainable regression model",
-                "version": "1.0.0"
-            },
-            {
-                "name": "robust_classifier",
-                "type": "robust",
-                "description": "Adversarially robust classifier",
-                "version": "1.0.0"
-            }
-        ]
-    }
+    return cached_json_response(request, _MODELS_JSON, _MODELS_ETAG)
 
 
 @app.post("/predict", response_model=PredictionResponse)
 async def predict(request: PredictionRequest):
     """Make prediction using specified model."""
+    # Get model (outside the try so the 404 is not re-wrapped as a 500)
+    model = ml_components.get(request.model_name)
+    if model is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Model '{request.model_name}' not found"
+        )
+    
     try:
-        # Validate model exists
-        if request.model_name not in ml_components:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Model '{request.model_name}' not found"
-            )
-        
-        # Get model
-        model = ml_components[request.model_name]
-        
         # Make prediction
         # prediction, confidence = await model.predict(request.input_data)
         
@@ -208,7 +366,7 @@ async def predict(request: PredictionRequest):
             explanation = "This is a placeholder explanation."
         
         # Placeholder response
-        return PredictionResponse(
+        return PredictionResponse.model_construct(
             prediction="sample_prediction",
             confidence=0.85,
             explanation=explanation,
@@ -221,30 +379,13 @@ async def predict(request: PredictionRequest):
 
 
 @app.get("/experiments")
-async def list_experiments():
+async def list_experiments(request: Request):
     """List available experiments."""
-    return {
-        "experiments": [
-            {
-                "id": "exp_001",
-                "name": "Neuro-Symbolic Integration Study",
-                "status": "completed",
-                "created_at": "2024-01-15T10:00:00Z",
-                "metrics": {"accuracy": 0.92, "explainability": 0.85}
-            },
-            {
-                "id": "exp_002",
-                "name": "Robustness Evaluation",
-                "status": "running",
-                "created_at": "2024-01-16T14:30:00Z",
-                "metrics": None
-            }
-        ]
-    }
+    return cached_json_response(request, _EXPERIMENTS_JSON, _EXPERIMENTS_ETAG)
 
 
 @app.get("/models/{model_name}/explain")
-async def explain_model(model_name: str):
+async def explain_model(model_name: str, request: Request):
     """Get model explanation capabilities."""
     if model_name not in ml_components:
         raise HTTPException(
@@ -252,41 +393,13 @@ async def explain_model(model_name: str):
             detail=f"Model '{model_name}' not found"
         )
     
-    return {
-        "model": model_name,
-        "explanation_methods": [
-            "shap",
-            "lime",
-            "attention_weights",
-            "feature_importance"
-        ],
-        "intrinsic_explainability": True,
-        "post_hoc_explanations": True
-    }
+    return cached_json_response(request, *_explain_json(model_name))
 
 
 @app.get("/limitations")
-async def get_limitations():
+async def get_limitations(request: Request):
     """Get information about AI limitations being addressed."""
-    return {
-        "limitations_addressed": [
-            {
-                "name": "Common Sense Gaps",
-                "solutions": ["neuro_symbolic_integration", "knowledge_grounding"],
-                "status": "in_development"
-            },
-            {
-                "name": "Explainability",
-                "solutions": ["intrinsic_explainability", "post_hoc_explanations"],
-                "status": "implemented"
-            },
-            {
-                "name": "Robustness",
-                "solutions": ["adversarial_training", "uncertainty_quantification"],
-                "status": "testing"
-            }
-        ]
-    }
+    return cached_json_response(request, _LIMITATIONS_JSON, _LIMITATIONS_ETAG)
 
 
 # Exception handlers
@@ -294,7 +407,7 @@ async def get_limitations():
 async def global_exception_handler(request, exc):
     """Global exception handler."""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"message": "Internal server error", "detail": str(exc)}
     )
@@ -318,6 +431,8 @@ def main():
         port=args.port,
         reload=args.reload,
         workers=args.workers if not args.reload else 1,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info"
     )
 
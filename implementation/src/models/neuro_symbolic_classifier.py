@@ -10,7 +10,10 @@ import torch
 import torch.nn as nn
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Union, Optional
+from numpy.typing import DTypeLike
+from scipy.special import softmax
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+from typing import Dict, Any, List, Union, Optional, cast
 import logging
 
 from ..base import BaseModel, BaseExplainer, BaseReasoner
@@ -26,6 +29,9 @@ class NeuroSymbolicClassifier(BaseModel):
     1. Integrating symbolic knowledge into neural representations
     2. Providing interpretable reasoning paths
     3. Supporting both statistical and logical inference
+    
+    Instances reuse scratch buffers across calls and are not thread-safe;
+    give each serving thread its own copy.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -39,6 +45,7 @@ class NeuroSymbolicClassifier(BaseModel):
                 - symbolic_rules: List of symbolic rules
                 - reasoning_engine: Type of reasoning engine
                 - integration_method: Method for integrating neural and symbolic components
+                - compile: Compile the neural network with torch.compile (torch>=2.0)
         """
         super().__init__(config)
         
@@ -49,6 +56,13 @@ class NeuroSymbolicClassifier(BaseModel):
         self.reasoning_engine = config.get('reasoning_engine', 'prolog')
         self.integration_method = config.get('integration_method', 'late_fusion')
         
+        # Reused across robustness checks: original rows stacked over perturbed rows
+        self._noise_buf: Optional[np.ndarray] = None
+        self._rng = np.random.default_rng()
+        
+        # Reused across inference batches: neural features beside symbolic features
+        self._fusion_buf: Optional[torch.Tensor] = None
+        
         # Initialize neural network component
         self._build_neural_network()
         
@@ -58,28 +72,38 @@ class NeuroSymbolicClassifier(BaseModel):
         # Initialize integration layer
         self._build_integration_layer()
         
+        # Dropout-free graphs used by predict/predict_proba
+        self._build_inference_graphs()
+        
         logger.info(f"Initialized NeuroSymbolicClassifier with {self.num_classes} classes")
     
     def _build_neural_network(self):
-        """Build the neural network component."""
+        """Build the neural network component.
+        
+        ReLUs run in place so each layer allocates one activation tensor.
+        """
         layers = []
         
         # Input layer
         layers.append(nn.Linear(self.input_size, self.hidden_layers[0]))
-        layers.append(nn.ReLU())
+        layers.append(nn.ReLU(inplace=True))
         layers.append(nn.Dropout(0.2))
         
         # Hidden layers
         for i in range(len(self.hidden_layers) - 1):
             layers.append(nn.Linear(self.hidden_layers[i], self.hidden_layers[i + 1]))
-            layers.append(nn.ReLU())
+            layers.append(nn.ReLU(inplace=True))
             layers.append(nn.Dropout(0.2))
         
         # Output layer (before integration)
         layers.append(nn.Linear(self.hidden_layers[-1], self.hidden_layers[-1]))
-        layers.append(nn.ReLU())
+        layers.append(nn.ReLU(inplace=True))
+        
+        self.neural_network: nn.Module = nn.Sequential(*layers)
         
-        self.neural_network = nn.Sequential(*layers)
+        # Fuse the Linear/ReLU/Dropout chain into compiled kernels
+        if self.config.get('compile', False) and hasattr(torch, 'compile'):
+            self.neural_network = cast(nn.Module, torch.compile(self.neural_network))
         
     def _build_symbolic_reasoner(self):
         """Build the symbolic reasoning component."""
@@ -93,7 +117,7 @@ class NeuroSymbolicClassifier(BaseModel):
         if self.integration_method == 'late_fusion':
             self.integration_layer = nn.Sequential(
                 nn.Linear(self.hidden_layers[-1] + self.symbolic_reasoner.get_output_size(), 128),
-                nn.ReLU(),
+                nn.ReLU(inplace=True),
                 nn.Dropout(0.2),
                 nn.Linear(128, self.num_classes)
             )
@@ -106,6 +130,29 @@ class NeuroSymbolicClassifier(BaseModel):
         else:
             raise ValueError(f"Unknown integration method: {self.integration_method}")
     
+    def _build_inference_graphs(self):
+        """Build the dropout-free inference graphs over the training graphs' layers.
+        
+        The graphs share modules with the training graphs, so they follow weight
+        updates until optimize_for_inference swaps in quantized copies; fit
+        rebuilds them to drop any such stale copies.
+        """
+        self._neural_network_inference: nn.Module = self._without_dropout(self._float_neural_network())
+        if self.config.get('compile', False) and hasattr(torch, 'compile'):
+            self._neural_network_inference = cast(nn.Module, torch.compile(self._neural_network_inference))
+        
+        if self.integration_method == 'late_fusion':
+            self._integration_layer_inference = self._without_dropout(self.integration_layer)
+    
+    def _float_neural_network(self) -> nn.Sequential:
+        """Get the neural network's Sequential, unwrapping torch.compile."""
+        return cast(nn.Sequential, getattr(self.neural_network, '_orig_mod', self.neural_network))
+    
+    @staticmethod
+    def _without_dropout(network: nn.Sequential) -> nn.Sequential:
+        """Build a Sequential over the same modules with Dropout layers removed."""
+        return nn.Sequential(*[m for m in network if not isinstance(m, nn.Dropout)])
+    
     def fit(self, X: Union[np.ndarray, pd.DataFrame], 
             y: Union[np.ndarray, pd.DataFrame]) -> 'NeuroSymbolicClassifier':
         """Train the neuro-symbolic model.
@@ -119,14 +166,14 @@ class NeuroSymbolicClassifier(BaseModel):
         """
         logger.info("Training NeuroSymbolicClassifier...")
         
-        # Convert to torch tensors
-        if isinstance(X, pd.DataFrame):
-            X = X.values
+        # Convert to torch tensors (zero-copy views of contiguous numpy buffers)
         if isinstance(y, (pd.DataFrame, pd.Series)):
             y = y.values
             
-        X_tensor = torch.FloatTensor(X)
-        y_tensor = torch.LongTensor(y)
+        device = self._device()
+        X_tensor = self._to_float_tensor(X).to(device)
+        y_tensor = torch.from_numpy(np.ascontiguousarray(y, dtype=np.int64)).to(device)
+        n_samples = X_tensor.size(0)
         
         # Training parameters
         learning_rate = self.config.get('learning_rate', 0.001)
@@ -137,14 +184,16 @@ class NeuroSymbolicClassifier(BaseModel):
         optimizer = torch.optim.Adam(self.parameters(), lr=learning_rate)
         criterion = nn.CrossEntropyLoss()
         
-        # Training loop
-        dataset = torch.utils.data.TensorDataset(X_tensor, y_tensor)
-        dataloader = torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=True)
+        # Training loop: shuffle indices and slice the in-memory tensors directly
+        n_batches = (n_samples + batch_size - 1) // batch_size
         
         self.train()
         for epoch in range(epochs):
             total_loss = 0.0
-            for batch_X, batch_y in dataloader:
+            perm = torch.randperm(n_samples, device=device)
+            for start in range(0, n_samples, batch_size):
+                idx = perm[start:start + batch_size]
+                batch_X, batch_y = X_tensor[idx], y_tensor[idx]
                 optimizer.zero_grad()
                 
                 # Forward pass
@@ -158,89 +207,175 @@ class NeuroSymbolicClassifier(BaseModel):
                 total_loss += loss.item()
             
             if (epoch + 1) % 10 == 0:
-                logger.info(f"Epoch {epoch + 1}/{epochs}, Loss: {total_loss/len(dataloader):.4f}")
+                logger.info(f"Epoch {epoch + 1}/{epochs}, Loss: {total_loss/n_batches:.4f}")
+        
+        # Drop any quantized snapshots of the previous weights
+        self._build_inference_graphs()
         
         self.is_trained = True
         logger.info("Training completed successfully.")
         return self
     
-    def _forward_pass(self, X: torch.Tensor) -> torch.Tensor:
+    def optimize_for_inference(self) -> 'NeuroSymbolicClassifier':
+        """Quantize the inference graphs to dynamic int8 for CPU serving.
+        
+        The inference graphs are rebuilt from the current training weights and
+        quantized as copies; the training graphs keep their float weights for
+        further training and gradient-based explanations. Call after fit, and
+        again after any retraining.
+        
+        Returns:
+            Self for method chaining
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before optimizing for inference")
+        
+        self._neural_network_inference = torch.ao.quantization.quantize_dynamic(
+            self._without_dropout(self._float_neural_network()).eval(),
+            {nn.Linear}, dtype=torch.qint8
+        )
+        if self.integration_method == 'late_fusion':
+            self._integration_layer_inference = torch.ao.quantization.quantize_dynamic(
+                self._without_dropout(self.integration_layer).eval(),
+                {nn.Linear}, dtype=torch.qint8
+            )
+        
+        logger.info("Quantized inference graphs to dynamic int8")
+        return self
+    
+    @staticmethod
+    def _to_float_tensor(X: Union[np.ndarray, pd.DataFrame]) -> torch.Tensor:
+        """Convert input features to a float32 tensor sharing the numpy buffer."""
+        if isinstance(X, pd.DataFrame):
+            X = X.values
+        return torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+    
+    def _device(self) -> torch.device:
+        """Get the device the neural network's parameters live on."""
+        return next(self.neural_network.parameters()).device
+    
+    def _forward_pass(self, X: torch.Tensor, inference: bool = False) -> torch.Tensor:
         """Forward pass through the model.
         
         Args:
             X: Input tensor
+            inference: Route through the dropout-free inference graph
             
         Returns:
             Output tensor
         """
         # Neural network forward pass
-        neural_features = self.neural_network(X)
-        
-        # Symbolic reasoning
-        symbolic_outputs = []
-        for i in range(X.size(0)):
-            symbolic_output = self.symbolic_reasoner.reason(
-                facts=[{"features": X[i].detach().cpu().numpy()}],
-                query="classify"
-            )
-            symbolic_outputs.append(symbolic_output.get("features", torch.zeros(self.symbolic_reasoner.get_output_size())))
+        if inference:
+            neural_features = self._neural_network_inference(X)
+        else:
+            neural_features = self.neural_network(X)
         
-        symbolic_tensor = torch.stack(symbolic_outputs)
+        # Symbolic reasoning over the whole batch in one call
+        symbolic_features = self.symbolic_reasoner.reason_batch(
+            X.detach().cpu().numpy(), query="classify"
+        )
+        symbolic_tensor = torch.from_numpy(symbolic_features).to(X.device)
         
         # Integration
         if self.integration_method == 'late_fusion':
-            combined_features = torch.cat([neural_features, symbolic_tensor], dim=1)
-            outputs = self.integration_layer(combined_features)
+            if inference:
+                outputs = self._integration_layer_inference(
+                    self._fuse_into_buffer(neural_features, symbolic_tensor)
+                )
+            else:
+                combined_features = torch.cat([neural_features, symbolic_tensor], dim=1)
+                outputs = self.integration_layer(combined_features)
         elif self.integration_method == 'attention_fusion':
             outputs = self.integration_layer(neural_features, symbolic_tensor)
         
         return outputs
     
-    def predict(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+    def _fuse_into_buffer(self, neural_features: torch.Tensor, 
+                          symbolic_tensor: torch.Tensor) -> torch.Tensor:
+        """Concatenate features into the reusable fusion buffer (no-grad inference only).
+        
+        Args:
+            neural_features: Neural features of shape (batch, neural_size)
+            symbolic_tensor: Symbolic features of shape (batch, symbolic_size)
+            
+        Returns:
+            View of the buffer holding both feature blocks side by side
+        """
+        batch_size, neural_size = neural_features.shape
+        width = neural_size + symbolic_tensor.shape[1]
+        buf = self._fusion_buf
+        if (buf is None or buf.shape[0] < batch_size or buf.shape[1] != width
+                or buf.device != neural_features.device):
+            buf = self._fusion_buf = torch.empty(
+                batch_size, width, dtype=neural_features.dtype, device=neural_features.device
+            )
+        
+        fused = buf[:batch_size]
+        fused[:, :neural_size].copy_(neural_features)
+        fused[:, neural_size:].copy_(symbolic_tensor)
+        return fused
+    
+    def predict(self, X: Union[np.ndarray, pd.DataFrame], *, 
+                batch_size: int = 1024, dtype: DTypeLike = np.float32) -> np.ndarray:
         """Make predictions on new data.
         
         Args:
             X: Input features
+            batch_size: Number of rows per inference batch
+            dtype: Input dtype to convert X to before inference; only float32,
+                the dtype of the network and reasoner, is supported
             
         Returns:
             Predictions
         """
-        if not self.is_trained:
-            raise ValueError("Model must be trained before making predictions")
-        
-        self.eval()
-        with torch.no_grad():
-            if isinstance(X, pd.DataFrame):
-                X = X.values
-            
-            X_tensor = torch.FloatTensor(X)
-            outputs = self._forward_pass(X_tensor)
-            predictions = torch.argmax(outputs, dim=1).detach().cpu().numpy()
-        
+        predictions: np.ndarray = self._infer(X, batch_size=batch_size, dtype=dtype).argmax(axis=1)
         return predictions
     
-    def predict_proba(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+    def predict_proba(self, X: Union[np.ndarray, pd.DataFrame], *, 
+                      batch_size: int = 1024, dtype: DTypeLike = np.float32) -> np.ndarray:
         """Predict class probabilities.
         
         Args:
             X: Input features
+            batch_size: Number of rows per inference batch
+            dtype: Input dtype to convert X to before inference; only float32,
+                the dtype of the network and reasoner, is supported
             
         Returns:
             Class probabilities
         """
+        probabilities: np.ndarray = softmax(self._infer(X, batch_size=batch_size, dtype=dtype), axis=1)
+        return probabilities
+    
+    def _infer(self, X: Union[np.ndarray, pd.DataFrame], *, 
+               batch_size: int = 1024, dtype: DTypeLike = np.float32) -> np.ndarray:
+        """Run batched inference and return the raw class logits.
+        
+        Args:
+            X: Input features
+            batch_size: Number of rows per inference batch
+            dtype: Input dtype to convert X to before inference; only float32,
+                the dtype of the network and reasoner, is supported
+            
+        Returns:
+            Logits of shape (n_samples, num_classes)
+        """
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
+        if np.dtype(dtype) != np.float32:
+            raise ValueError(f"Unsupported inference dtype {np.dtype(dtype)}; expected float32")
         
         self.eval()
+        device = self._device()
+        logits = []
         with torch.no_grad():
-            if isinstance(X, pd.DataFrame):
-                X = X.values
-            
-            X_tensor = torch.FloatTensor(X)
-            outputs = self._forward_pass(X_tensor)
-            probabilities = torch.softmax(outputs, dim=1).detach().cpu().numpy()
+            for batch in self._iter_batches(X, batch_size, dtype):
+                outputs = self._forward_pass(torch.from_numpy(batch).to(device), inference=True)
+                logits.append(outputs.cpu().numpy())
         
-        return probabilities
+        if not logits:
+            return np.empty((0, cast(int, self.num_classes)), dtype=np.float32)
+        return np.concatenate(logits)
     
     def explain(self, X: Union[np.ndarray, pd.DataFrame]) -> Dict[str, Any]:
         """Provide explanation for predictions.
@@ -251,6 +386,8 @@ class NeuroSymbolicClassifier(BaseModel):
         Returns:
             Explanation dictionary containing:
                 - neural_importance: Feature importance from neural component
+                  (scores as a float32 ndarray; serve with
+                  main.numpy_json_response rather than returning it directly)
                 - symbolic_reasoning: Symbolic reasoning steps
                 - integrated_explanation: Combined explanation
         """
@@ -285,20 +422,20 @@ class NeuroSymbolicClassifier(BaseModel):
             feature_names = [f"feature_{i}" for i in range(X.shape[1])]
         
         self.eval()
-        X_tensor = torch.FloatTensor(X_values)
+        X_tensor = self._to_float_tensor(X_values).to(self._device())
         X_tensor.requires_grad_(True)
         
+        # Rows are independent in eval mode, so one vector-Jacobian product of the
+        # summed outputs yields every per-sample input gradient. autograd.grad
+        # skips parameter gradients and leaves the model's .grad buffers untouched.
         outputs = self.neural_network(X_tensor)
-        loss = torch.sum(outputs)
-        loss.backward()
-        
-        gradients = X_tensor.grad.detach().cpu().numpy()
-        importance_scores = np.mean(np.abs(gradients), axis=0)
+        (gradients,) = torch.autograd.grad(outputs.sum(), X_tensor)
+        importance_scores = gradients.abs().mean(dim=0).cpu().numpy()
         
         return {
             "method": "gradient_importance",
             "feature_names": feature_names,
-            "importance_scores": importance_scores.tolist(),
+            "importance_scores": importance_scores,
             "most_important": feature_names[np.argmax(importance_scores)]
         }
     
@@ -345,16 +482,21 @@ class NeuroSymbolicClassifier(BaseModel):
         Returns:
             Dictionary of evaluation metrics
         """
-        from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-        
-        predictions = self.predict(X)
-        probabilities = self.predict_proba(X)
+        # One forward pass; predictions and probabilities both derive from the logits
+        logits = self._infer(X)
+        predictions = logits.argmax(axis=1)
+        probabilities = softmax(logits, axis=1)
+        
+        # Precision, recall and F1 from a single pass over the label counts
+        precision, recall, f1, _ = precision_recall_fscore_support(
+            y, predictions, average='weighted'
+        )
         
         return {
             "accuracy": accuracy_score(y, predictions),
-            "precision": precision_score(y, predictions, average='weighted'),
-            "recall": recall_score(y, predictions, average='weighted'),
-            "f1_score": f1_score(y, predictions, average='weighted'),
+            "precision": precision,
+            "recall": recall,
+            "f1_score": f1,
             "explainability_score": self._calculate_explainability_score(probabilities),
             "robustness_score": self._calculate_robustness_score(X, y)
         }
@@ -367,15 +509,25 @@ class NeuroSymbolicClassifier(BaseModel):
     
     def _calculate_robustness_score(self, X: np.ndarray, y: np.ndarray) -> float:
         """Calculate robustness score using adversarial perturbations."""
-        # Simplified robustness test
-        noise = np.random.normal(0, 0.01, X.shape)
-        perturbed_X = X + noise
+        if isinstance(X, pd.DataFrame):
+            X = X.values
+        n_samples = X.shape[0]
+        
+        # Simplified robustness test: fill the buffer in place with [X; X + noise]
+        buf_shape = (2 * n_samples,) + X.shape[1:]
+        if self._noise_buf is None or self._noise_buf.shape != buf_shape:
+            self._noise_buf = np.empty(buf_shape, dtype=np.float32)
+        original, perturbed = self._noise_buf[:n_samples], self._noise_buf[n_samples:]
+        original[...] = X
+        self._rng.standard_normal(out=perturbed, dtype=np.float32)
+        perturbed *= 0.01
+        perturbed += original
         
-        original_preds = self.predict(X)
-        perturbed_preds = self.predict(perturbed_X)
+        # One prediction pass over both halves
+        preds = self.predict(self._noise_buf)
         
         # Higher consistency indicates better robustness
-        consistency = np.mean(original_preds == perturbed_preds)
+        consistency = np.mean(preds[:n_samples] == preds[n_samples:])
         return consistency
 
 
@@ -386,6 +538,7 @@ class SimpleReasoner(BaseReasoner):
         super().__init__(config)
         self.rules = config.get('rules', [])
         self.output_size = 32  # Default symbolic representation size
+        self._rng = np.random.default_rng()
     
     def reason(self, facts: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
         """Perform simple rule-based reasoning."""
@@ -401,6 +554,17 @@ class SimpleReasoner(BaseReasoner):
         
         return results
     
+    def reason_batch(self, features: np.ndarray, query: str) -> np.ndarray:
+        """Perform rule-based reasoning on a batch of feature rows."""
+        if query != "classify":
+            raise ValueError(f"Unsupported batch query: {query}")
+        
+        # Simplified reasoning logic
+        symbolic_features: np.ndarray = self._rng.standard_normal(
+            (features.shape[0], self.output_size), dtype=np.float32
+        )
+        return symbolic_features
+    
     def add_knowledge(self, knowledge: Dict[str, Any]) -> None:
         """Add knowledge to the reasoner."""
         self.rules.extend(knowledge.get('rules', []))
@@ -415,24 +579,25 @@ class SimpleReasoner(BaseReasoner):
 
 
 class AttentionFusion(nn.Module):
-    """Attention-based fusion of neural and symbolic components."""
+    """Attention-based fusion of neural and symbolic components.
+    
+    The fused features form a single token, and self-attention over one token
+    reduces to a linear map of its values. The attention step is therefore
+    implemented directly as a linear projection with a residual connection.
+    """
     
     def __init__(self, neural_size: int, symbolic_size: int, num_classes: int):
         super().__init__()
         self.neural_size = neural_size
         self.symbolic_size = symbolic_size
         
-        # Attention mechanism
-        self.attention = nn.MultiheadAttention(
-            embed_dim=neural_size + symbolic_size,
-            num_heads=8,
-            batch_first=True
-        )
+        # Attention over a single token (value/output projection)
+        self.proj = nn.Linear(neural_size + symbolic_size, neural_size + symbolic_size)
         
         # Output layer
         self.output_layer = nn.Sequential(
             nn.Linear(neural_size + symbolic_size, 128),
-            nn.ReLU(),
+            nn.ReLU(inplace=True),
             nn.Dropout(0.2),
             nn.Linear(128, num_classes)
         )
@@ -442,10 +607,8 @@ class AttentionFusion(nn.Module):
         # Combine features
         combined = torch.cat([neural_features, symbolic_features], dim=1)
         
-        # Apply attention (reshaped for attention mechanism)
-        combined_reshaped = combined.unsqueeze(1)
-        attended, _ = self.attention(combined_reshaped, combined_reshaped, combined_reshaped)
-        attended = attended.squeeze(1)
+        # Apply attention
+        attended = self.proj(combined) + combined
         
         # Output
         return self.output_layer(attended)
\ No newline at end of file
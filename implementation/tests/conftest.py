@@ -0,0 +1,7 @@
+"""
+Shared test setup for the implementation API tests.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
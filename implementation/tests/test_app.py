@@ -0,0 +1,25 @@
+"""
+Tests for the implementation API.
+"""
+import numpy as np
+import orjson
+
+import main
+
+
+class TestNumpyJsonResponse:
+    """Tests for serving payloads that hold numpy arrays."""
+
+    def test_serializes_explanation_arrays(self):
+        explanation = {
+            "method": "gradient_importance",
+            "feature_names": ["feature_0", "feature_1"],
+            "importance_scores": np.array([0.25, 0.75], dtype=np.float32),
+            "most_important": "feature_1",
+        }
+
+        response = main.numpy_json_response(explanation)
+
+        assert response.media_type == "application/json"
+        assert orjson.loads(response.body)["importance_scores"] == [0.25, 0.75]
+
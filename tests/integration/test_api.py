@@ -3,9 +3,10 @@
 Integration tests for the API service.
 """
 import os
-import time
 import requests
 import unittest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 
 
@@ -17,23 +18,32 @@ class TestAPIIntegration(unittest.TestCase):
         """Set up test class."""
         cls.api_url = os.environ.get('API_URL', 'http://localhost:8002')
         cls.max_retries = 5
-        cls.retry_delay = 2
+
+        # Shared keep-alive session so tests reuse pooled connections; retries
+        # back off exponentially while the service starts
+        cls.session = requests.Session()
+        retry = Retry(
+            total=cls.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        cls.session.mount('http://', adapter)
+        cls.session.mount('https://', adapter)
 
         # Wait for API to be ready
-        for i in range(cls.max_retries):
-            try:
-                response = requests.get(f"{cls.api_url}/health", timeout=5)
-                if response.status_code == 200:
-                    print(f"API is ready after {i+1} attempts")
-                    break
-            except (requests.ConnectionError, requests.Timeout):
-                if i == cls.max_retries - 1:
-                    raise
-                time.sleep(cls.retry_delay)
+        response = cls.session.get(f"{cls.api_url}/health", timeout=5)
+        response.raise_for_status()
+        print("API is ready")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down test class."""
+        cls.session.close()
 
     def test_health_endpoint(self):
         """Test the health endpoint."""
-        response = requests.get(f"{self.api_url}/health")
+        response = self.session.get(f"{self.api_url}/health")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data['status'], 'healthy')
@@ -41,7 +51,7 @@ class TestAPIIntegration(unittest.TestCase):
     def test_api_endpoint(self):
         """Test a basic API endpoint."""
         # This is a placeholder - replace with actual API endpoints
-        response = requests.get(f"{self.api_url}/api/v1/info")
+        response = self.session.get(f"{self.api_url}/api/v1/info")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertIn('version', data)